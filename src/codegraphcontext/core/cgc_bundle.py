@@ -25,10 +25,15 @@ import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
+import shutil
 import subprocess
 
 from codegraphcontext.utils.debug_log import debug_log, info_logger, error_logger, warning_logger
 
+# Resolve the git binary once at import so each invocation skips the execvp
+# PATH search (and later PATH changes can't redirect it).
+_GIT = shutil.which("git") or "git"
+
 
 class CGCBundle:
     """Handles creation and loading of .cgc bundle files."""
@@ -273,7 +278,7 @@ class CGCBundle:
             if repo_path and repo_path.exists():
                 try:
                     commit = subprocess.check_output(
-                        ['git', 'rev-parse', 'HEAD'],
+                        [_GIT, 'rev-parse', 'HEAD'],
                         cwd=repo_path,
                         stderr=subprocess.DEVNULL
                     ).decode().strip()
@@ -15,10 +15,14 @@ Configuration is read from environment variables:
 - FALKORDB_USERNAME: Authentication username (optional, default: None)
 - FALKORDB_SSL: Enable SSL/TLS (default: false)
 - FALKORDB_GRAPH_NAME: Graph name to use (default: codegraph)
+- FALKORDB_POOL_SIZE: Max concurrent connections in the pool (default: 25)
 """
 import os
 import atexit
+import queue
 import threading
+import time
+from dataclasses import dataclass
 from typing import Optional, Tuple
 
 from codegraphcontext.utils.debug_log import info_logger, error_logger
@@ -31,6 +35,208 @@ from codegraphcontext.core.database_falkordb import (
 )
 
 
+@dataclass(frozen=True)
+class _FalkorConfig:
+    """Immutable snapshot of the FALKORDB_* environment variables."""
+    host: Optional[str]
+    port_str: str
+    port: Optional[int]  # None when FALKORDB_PORT is not numeric
+    password: Optional[str]
+    username: Optional[str]
+    ssl: bool
+    graph_name: str
+    pool_size: int
+
+
+# Values of FALKORDB_SSL (and any future boolean env vars) treated as true.
+_TRUTHY = frozenset({'true', '1', 'yes'})
+
+# Exception types that indicate the underlying socket is unusable. Ordinary
+# query errors (bad Cypher, constraint violations, ...) are not in this set:
+# they leave the connection healthy and it should go back into the pool.
+try:
+    from redis.exceptions import ConnectionError as _RedisConnectionError
+    from redis.exceptions import TimeoutError as _RedisTimeoutError
+    _CONNECTION_ERRORS = (OSError, _RedisConnectionError, _RedisTimeoutError)
+except ImportError:  # redis ships with falkordb; fall back to socket errors
+    _CONNECTION_ERRORS = (OSError,)
+
+# Environment variables are not expected to change after process start, so the
+# parsed configuration is read once and cached at module scope. Tests that
+# mutate the environment must call _reset_config_for_tests().
+_CONFIG: Optional[_FalkorConfig] = None
+_CONFIG_LOCK = threading.Lock()
+
+
+def _load_config() -> _FalkorConfig:
+    """Returns the cached config, reading the environment on first call only."""
+    global _CONFIG
+    cfg = _CONFIG
+    if cfg is None:
+        with _CONFIG_LOCK:
+            cfg = _CONFIG
+            if cfg is None:
+                port_str = os.getenv('FALKORDB_PORT', '6379')
+                try:
+                    port = int(port_str)
+                except ValueError:
+                    port = None
+                try:
+                    pool_size = int(os.getenv('FALKORDB_POOL_SIZE', ''))
+                except ValueError:
+                    pool_size = _DEFAULT_POOL_SIZE
+                cfg = _FalkorConfig(
+                    host=os.getenv('FALKORDB_HOST'),
+                    port_str=port_str,
+                    port=port,
+                    password=os.getenv('FALKORDB_PASSWORD') or None,
+                    username=os.getenv('FALKORDB_USERNAME') or None,
+                    ssl=os.getenv('FALKORDB_SSL', 'false').lower() in _TRUTHY,
+                    graph_name=os.getenv('FALKORDB_GRAPH_NAME', 'codegraph'),
+                    pool_size=max(1, pool_size),
+                )
+                _CONFIG = cfg
+    return cfg
+
+
+def _reset_config_for_tests() -> None:
+    """Clears the cached config so tests can re-read a patched environment."""
+    global _CONFIG
+    with _CONFIG_LOCK:
+        _CONFIG = None
+
+
+# How long a successful ping() is trusted before re-querying the server.
+_PING_TTL_SECONDS = 30.0
+
+# Default size of the remote connection pool when FALKORDB_POOL_SIZE is unset.
+_DEFAULT_POOL_SIZE = 25
+
+# Queue sentinel left behind by _FalkorDBConnectionPool.discard(): the next
+# acquirer that receives it opens a fresh connection instead of reusing a
+# dropped one. This is what wakes acquirers blocked on a saturated pool when
+# a connection dies, rather than leaving them waiting on a slot that no
+# longer exists.
+_RECONNECT = object()
+
+
+class _FalkorDBConnectionPool:
+    """
+    A bounded pool of (FalkorDB, graph) pairs to a remote server.
+
+    Connections are created lazily on demand up to `maxsize`, so idle
+    processes keep a single socket while concurrent query workloads scale
+    out instead of serializing behind one shared connection.
+    """
+
+    def __init__(self, connect, maxsize: int):
+        self._connect = connect  # () -> (driver, graph)
+        self._maxsize = maxsize
+        self._idle = queue.Queue(maxsize=maxsize)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Checks out a connection, creating one if under the size limit."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = None
+
+        if conn is None:
+            with self._lock:
+                can_create = self._created < self._maxsize
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    return self._connect()
+                except Exception:
+                    # Keep the slot claimed and leave a reconnect token, as
+                    # discard() does: an acquirer blocked below would never
+                    # wake if the slot silently vanished. The connect error
+                    # still surfaces to this caller; the waiter retries.
+                    self._idle.put(_RECONNECT)
+                    raise
+
+            # Pool is at capacity — wait for a connection (or a reconnect
+            # token from discard()) to be released.
+            conn = self._idle.get()
+
+        if conn is _RECONNECT:
+            try:
+                return self._connect()
+            except Exception:
+                # Hand the token back so other waiters aren't stranded on a
+                # slot that has no connection behind it.
+                self._idle.put(_RECONNECT)
+                raise
+        return conn
+
+    def release(self, conn) -> None:
+        """Returns a healthy connection to the pool."""
+        self._idle.put(conn)
+
+    def discard(self, conn) -> None:
+        """Closes a broken connection, freeing its slot for a fresh one."""
+        self._close_conn(conn)
+        # The token keeps the slot visible to blocked acquirers; merely
+        # decrementing _created would leave them waiting forever on an
+        # idle queue that never refills.
+        self._idle.put(_RECONNECT)
+
+    def close(self) -> None:
+        """Closes all idle connections and resets the pool."""
+        with self._lock:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if conn is not _RECONNECT:
+                    self._close_conn(conn)
+                self._created -= 1
+
+    @staticmethod
+    def _close_conn(conn) -> None:
+        """Closes a (driver, graph) pair, ignoring errors on dead sockets."""
+        try:
+            conn[0].close()
+        except Exception:
+            pass
+
+
+class _PooledFalkorDBSessionWrapper(FalkorDBSessionWrapper):
+    """A session bound to one pooled connection, returned on exit."""
+
+    def __init__(self, pool: _FalkorDBConnectionPool, conn):
+        super().__init__(conn[1])
+        self._pool = pool
+        self._conn = conn
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._conn is not None:
+            # Only connection-level failures poison the socket; application
+            # errors (bad Cypher and the like) leave it healthy, so recycle
+            # it rather than churning the pool.
+            if exc_type is not None and issubclass(exc_type, _CONNECTION_ERRORS):
+                self._pool.discard(self._conn)
+            else:
+                self._pool.release(self._conn)
+            self._conn = None
+
+
+class _PooledFalkorDBDriverWrapper(FalkorDBDriverWrapper):
+    """Driver wrapper whose sessions each check out their own connection."""
+
+    def __init__(self, pool: _FalkorDBConnectionPool, graph):
+        super().__init__(graph)
+        self._pool = pool
+
+    def session(self):
+        return _PooledFalkorDBSessionWrapper(self._pool, self._pool.acquire())
+
+
 class FalkorDBRemoteManager:
     """
     Manages a remote FalkorDB database connection as a singleton.
@@ -39,6 +245,8 @@ class FalkorDBRemoteManager:
     _instance = None
     _driver = None
     _graph = None
+    _pool = None
+    _wrapper = None  # cached FalkorDBDriverWrapper, published last — see get_driver
     _lock = threading.Lock()
 
     def __new__(cls):
@@ -52,83 +260,141 @@ class FalkorDBRemoteManager:
         if hasattr(self, '_initialized'):
             return
 
-        self.host = os.getenv('FALKORDB_HOST', 'localhost')
-        self.port = int(os.getenv('FALKORDB_PORT', '6379'))
-        self.password = os.getenv('FALKORDB_PASSWORD') or None
-        self.username = os.getenv('FALKORDB_USERNAME') or None
-        self.ssl = os.getenv('FALKORDB_SSL', 'false').lower() in ('true', '1', 'yes')
-        self.graph_name = os.getenv('FALKORDB_GRAPH_NAME', 'codegraph')
+        config = _load_config()
+        if config.port is None:
+            raise ValueError(f"FALKORDB_PORT must be a number, got '{config.port_str}'.")
+
+        self.host = config.host or 'localhost'
+        self.port = config.port
+        self.password = config.password
+        self.username = config.username
+        self.ssl = config.ssl
+        self.graph_name = config.graph_name
+        self.pool_size = config.pool_size
+        self._last_ping = None  # monotonic timestamp of the last successful ping
         self._initialized = True
 
         atexit.register(self.shutdown)
 
-    def get_driver(self):
+    def get_driver(self, verify: bool = False):
         """
         Gets the remote FalkorDB connection, creating it if necessary.
         Thread-safe.
 
+        Args:
+            verify: When True, issue a ``RETURN 1`` round-trip after connecting
+                to confirm the server is reachable. Off by default — the next
+                real query surfaces connection errors without the extra RTT.
+
         Returns:
             A FalkorDBDriverWrapper that provides a Neo4j-like session interface.
         """
-        if self._driver is None:
-            with self._lock:
-                if self._driver is None:
-                    try:
-                        from falkordb import FalkorDB
-
-                        info_logger(
-                            f"Connecting to remote FalkorDB at {self.host}:{self.port} "
-                            f"(ssl={self.ssl})"
-                        )
-
-                        kwargs = {
-                            'host': self.host,
-                            'port': self.port,
-                        }
-                        if self.password:
-                            kwargs['password'] = self.password
-                        if self.username:
-                            kwargs['username'] = self.username
-                        if self.ssl:
-                            kwargs['ssl'] = True
-
-                        self._driver = FalkorDB(**kwargs)
-                        self._graph = self._driver.select_graph(self.graph_name)
-
-                        # Verify connectivity
-                        self._graph.query("RETURN 1")
-                        info_logger("Remote FalkorDB connection established successfully")
-                        info_logger(f"Graph name: {self.graph_name}")
-
-                    except ImportError as e:
-                        error_logger(
-                            "FalkorDB client is not installed. Install it with:\n"
-                            "  pip install falkordb"
-                        )
-                        raise ValueError("FalkorDB client missing.") from e
-                    except Exception as e:
-                        error_logger(f"Failed to connect to remote FalkorDB: {e}")
-                        raise
-
-        return FalkorDBDriverWrapper(self._graph)
+        # Lock-free fast path: _wrapper is only ever assigned a wrapper over a
+        # fully initialized connection, so a single read is safe here. Reusing
+        # one wrapper also avoids allocating a new object per call.
+        wrapper = self._wrapper
+        if wrapper is not None:
+            return wrapper
+
+        with self._lock:
+            if self._wrapper is None:
+                try:
+                    from falkordb import FalkorDB
+
+                    info_logger(
+                        f"Connecting to remote FalkorDB at {self.host}:{self.port} "
+                        f"(ssl={self.ssl})"
+                    )
+
+                    kwargs = {
+                        'host': self.host,
+                        'port': self.port,
+                    }
+                    if self.password:
+                        kwargs['password'] = self.password
+                    if self.username:
+                        kwargs['username'] = self.username
+                    if self.ssl:
+                        kwargs['ssl'] = True
+
+                    graph_name = self.graph_name
+
+                    def _connect():
+                        driver = FalkorDB(**kwargs)
+                        return driver, driver.select_graph(graph_name)
+
+                    pool = _FalkorDBConnectionPool(_connect, self.pool_size)
+                    # Establish the first connection eagerly so configuration
+                    # errors surface here rather than on the first query.
+                    conn = pool.acquire()
+                    driver, graph = conn
+
+                    if verify:
+                        graph.query("RETURN 1")
+                        self._last_ping = time.monotonic()
+                    pool.release(conn)
+                    info_logger("Remote FalkorDB connection established successfully")
+                    info_logger(f"Graph name: {self.graph_name} (pool size: {self.pool_size})")
+
+                    self._driver = driver
+                    self._graph = graph
+                    self._pool = pool
+                    # Publish last so the fast path above never observes a
+                    # half-initialized connection.
+                    self._wrapper = _PooledFalkorDBDriverWrapper(pool, graph)
+
+                except ImportError as e:
+                    error_logger(
+                        "FalkorDB client is not installed. Install it with:\n"
+                        "  pip install falkordb"
+                    )
+                    raise ValueError("FalkorDB client missing.") from e
+                except Exception as e:
+                    error_logger(f"Failed to connect to remote FalkorDB: {e}")
+                    raise
+
+            return self._wrapper
 
     def close_driver(self):
         """Closes the connection."""
         if self._driver is not None:
             info_logger("Closing FalkorDB Remote connection")
+            if self._pool is not None:
+                self._pool.close()
+            self._wrapper = None
+            self._pool = None
             self._driver = None
             self._graph = None
+            self._last_ping = None
 
     def shutdown(self):
         """Clean up on exit. No subprocess to kill for remote connections."""
         self.close_driver()
 
     def is_connected(self) -> bool:
-        """Checks if the database connection is currently active."""
+        """
+        Checks if a database connection has been established.
+
+        This is a local state check only — no network round-trip. Use ping()
+        for an explicit liveness probe.
+        """
+        return self._graph is not None
+
+    def ping(self) -> bool:
+        """
+        Actively verifies the connection with a ``RETURN 1`` query.
+
+        A successful result is cached for a short TTL so health-check loops
+        polling faster than the TTL don't pay one RTT per poll.
+        """
         if self._graph is None:
             return False
+        now = time.monotonic()
+        if self._last_ping is not None and now - self._last_ping < _PING_TTL_SECONDS:
+            return True
         try:
             self._graph.query("RETURN 1")
+            self._last_ping = now
             return True
         except Exception:
             return False
@@ -145,17 +411,14 @@ class FalkorDBRemoteManager:
         Returns:
             Tuple[bool, Optional[str]]: (is_valid, error_message)
         """
-        host = os.getenv('FALKORDB_HOST')
-        if not host:
+        config = _load_config()
+        if not config.host:
             return False, "FALKORDB_HOST environment variable is not set."
 
-        port_str = os.getenv('FALKORDB_PORT', '6379')
-        try:
-            port = int(port_str)
-            if not (1 <= port <= 65535):
-                return False, f"FALKORDB_PORT must be between 1 and 65535, got {port}."
-        except ValueError:
-            return False, f"FALKORDB_PORT must be a number, got '{port_str}'."
+        if config.port is None:
+            return False, f"FALKORDB_PORT must be a number, got '{config.port_str}'."
+        if not (1 <= config.port <= 65535):
+            return False, f"FALKORDB_PORT must be between 1 and 65535, got {config.port}."
 
         return True, None
 
@@ -172,27 +435,21 @@ class FalkorDBRemoteManager:
                 "Install it with: pip install falkordb"
             )
 
-        host = os.getenv('FALKORDB_HOST')
-        if not host:
+        config = _load_config()
+        if not config.host:
             return False, "FALKORDB_HOST is not set."
 
-        port = int(os.getenv('FALKORDB_PORT', '6379'))
-        password = os.getenv('FALKORDB_PASSWORD') or None
-        username = os.getenv('FALKORDB_USERNAME') or None
-        ssl = os.getenv('FALKORDB_SSL', 'false').lower() in ('true', '1', 'yes')
-        graph_name = os.getenv('FALKORDB_GRAPH_NAME', 'codegraph')
-
         try:
-            kwargs = {'host': host, 'port': port}
-            if password:
-                kwargs['password'] = password
-            if username:
-                kwargs['username'] = username
-            if ssl:
+            kwargs = {'host': config.host, 'port': config.port}
+            if config.password:
+                kwargs['password'] = config.password
+            if config.username:
+                kwargs['username'] = config.username
+            if config.ssl:
                 kwargs['ssl'] = True
 
             db = FalkorDB(**kwargs)
-            graph = db.select_graph(graph_name)
+            graph = db.select_graph(config.graph_name)
             graph.query("RETURN 1")
             return True, None
         except Exception as e:
@@ -71,19 +71,45 @@ class JobManager:
         self.jobs: Dict[str, JobInfo] = {}
         self.lock = threading.Lock() # A lock to ensure thread-safe access to the jobs dictionary.
 
-    def create_job(self, path: str, is_dependency: bool = False) -> str:
-        """Creates a new job, assigns it a unique ID, and stores it."""
+    def create_job(self, path: str, is_dependency: bool = False,
+                   total_files: int = 0, estimated_duration: Optional[float] = None) -> str:
+        """
+        Creates a new job, assigns it a unique ID, and stores it.
+
+        Known-up-front metadata (total_files, estimated_duration) can be passed
+        directly so callers don't need a create_job/update_job round-trip.
+        """
         job_id = str(uuid.uuid4())
         with self.lock:
             self.jobs[job_id] = JobInfo(
                 job_id=job_id,
                 status=JobStatus.PENDING,
                 start_time=datetime.now(),
+                total_files=total_files,
+                estimated_duration=estimated_duration,
                 path=path,
                 is_dependency=is_dependency
             )
         return job_id
 
+    def submit_many(self, loop, coros) -> None:
+        """
+        Schedules a batch of coroutines on the event loop with a single wakeup.
+
+        asyncio.run_coroutine_threadsafe wakes the loop's selector once per
+        coroutine; scheduling the whole batch inside one call_soon_threadsafe
+        callback costs one wakeup regardless of the batch size.
+        """
+        coros = list(coros)
+        if not coros:
+            return
+
+        def _schedule():
+            for coro in coros:
+                loop.create_task(coro)
+
+        loop.call_soon_threadsafe(_schedule)
+
     def update_job(self, job_id: str, **kwargs):
         """Updates the information for a specific job in a thread-safe manner."""
         with self.lock:
@@ -125,8 +125,11 @@ class MCPServer:
         self.tools = TOOLS
 
     def get_database_status(self) -> dict:
-        """Returns the current connection status of the Neo4j database."""
-        return {"connected": self.db_manager.is_connected()}
+        """Returns the current connection status of the database."""
+        # Prefer ping() where the backend offers it (TTL-cached liveness
+        # probe); is_connected() may be a local state check only.
+        check = getattr(self.db_manager, "ping", self.db_manager.is_connected)
+        return {"connected": check()}
         
 
     # --- Tool Wrappers ---
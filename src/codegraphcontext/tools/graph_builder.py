@@ -2,6 +2,7 @@
 # src/codegraphcontext/tools/graph_builder.py
 import asyncio
 import json
+import os
 import pathspec
 from pathlib import Path
 from typing import Any, Coroutine, Dict, Optional, Tuple
@@ -999,32 +1000,38 @@ class GraphBuilder:
     def estimate_processing_time(self, path: Path) -> Optional[Tuple[int, float]]:
         """Estimate processing time and file count"""
         try:
-            supported_extensions = self.parsers.keys()
+            supported_extensions = frozenset(self.parsers.keys())
             if path.is_file():
                 if path.suffix in supported_extensions:
-                    files = [path]
+                    total_files = 1
                 else:
                     return 0, 0.0 # Not a supported file type
             else:
-                all_files = path.rglob("*")
-                files = [f for f in all_files if f.is_file() and f.suffix in supported_extensions]
-
-                # Filter default ignored directories
                 ignore_dirs_str = get_config_value("IGNORE_DIRS") or ""
-                if ignore_dirs_str:
-                    ignore_dirs = {d.strip().lower() for d in ignore_dirs_str.split(',') if d.strip()}
-                    if ignore_dirs:
-                        kept_files = []
-                        for f in files:
-                            try:
-                                parts = set(p.lower() for p in f.relative_to(path).parent.parts)
-                                if not parts.intersection(ignore_dirs):
-                                    kept_files.append(f)
-                            except ValueError:
-                                kept_files.append(f)
-                        files = kept_files
-            
-            total_files = len(files)
+                ignore_dirs = {d.strip().lower() for d in ignore_dirs_str.split(',') if d.strip()}
+
+                # Iterative os.scandir walk: dirent type information answers the
+                # is-dir/is-file question without a stat per entry, and pruning
+                # ignored directories here skips their subtrees entirely instead
+                # of filtering the full rglob listing after the fact.
+                total_files = 0
+                stack = [str(path)]
+                while stack:
+                    try:
+                        with os.scandir(stack.pop()) as entries:
+                            for entry in entries:
+                                try:
+                                    if entry.is_dir(follow_symlinks=False):
+                                        if entry.name.lower() not in ignore_dirs:
+                                            stack.append(entry.path)
+                                    elif entry.is_file(follow_symlinks=False):
+                                        if os.path.splitext(entry.name)[1] in supported_extensions:
+                                            total_files += 1
+                                except OSError:
+                                    continue
+                    except OSError:
+                        continue
+
             estimated_time = total_files * 0.05 # tree-sitter is faster
             return total_files, estimated_time
         except Exception as e:
@@ -1056,9 +1063,13 @@ class GraphBuilder:
         repo_name = path.name
 
         try:
-            # Step 1: Run SCIP indexer
+            # Step 1: Run SCIP indexer. The CLI can take minutes on large
+            # projects, so run it in a worker thread rather than blocking the
+            # event loop (and every other in-flight job) for the duration.
             with tempfile.TemporaryDirectory(prefix="cgc_scip_") as tmpdir:
-                scip_file = ScipIndexer().run(path, lang, Path(tmpdir))
+                scip_file = await asyncio.to_thread(
+                    ScipIndexer().run, path, lang, Path(tmpdir)
+                )
 
                 if not scip_file:
                     warning_logger(
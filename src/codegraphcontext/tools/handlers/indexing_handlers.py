@@ -1,10 +1,16 @@
 from typing import Any, Dict
 from pathlib import Path
-import asyncio
 import os
 from ...utils.debug_log import debug_log
 from ..package_resolver import get_local_package_path
 
+
+def _format_duration(seconds: float) -> str:
+    """Formats an estimated duration in seconds as a short human string."""
+    m, s = divmod(int(seconds), 60)
+    return f"{m}m {s}s" if m else f"{s}s"
+
+
 def add_code_to_graph(graph_builder, job_manager, loop, list_repos_func, **args) -> Dict[str, Any]:
     """
     Tool implementation to index a directory of code.
@@ -14,7 +20,10 @@ def add_code_to_graph(graph_builder, job_manager, loop, list_repos_func, **args)
     is_dependency = args.get("is_dependency", False)
     
     try:
+        # Resolve once; every downstream consumer works from the same
+        # canonical path string instead of re-resolving.
         path_obj = Path(path).resolve()
+        path_str = str(path_obj)
 
         if not path_obj.exists():
             return {
@@ -23,34 +32,38 @@ def add_code_to_graph(graph_builder, job_manager, loop, list_repos_func, **args)
                 "message": f"Path '{path}' does not exist."
             }
 
-        # Prevent re-indexing the same repository.
-        indexed_repos = list_repos_func().get("repositories", [])
-        for repo in indexed_repos:
-            if Path(repo["path"]).resolve() == path_obj:
-                return {
-                    "success": False,
-                    "message": f"Repository '{path}' is already indexed."
-                }
+        # Prevent re-indexing the same repository. Stored repo paths are already
+        # canonical (they come from resolved paths at index time), so a set
+        # membership test avoids re-resolving every entry on every request.
+        indexed_paths = frozenset(
+            repo["path"] for repo in list_repos_func().get("repositories", [])
+        )
+        if path_str in indexed_paths:
+            return {
+                "success": False,
+                "message": f"Repository '{path}' is already indexed."
+            }
         
         # Estimate time and create a job for the user to track.
         total_files, estimated_time = graph_builder.estimate_processing_time(path_obj)
-        job_id = job_manager.create_job(str(path_obj), is_dependency)
-        job_manager.update_job(job_id, total_files=total_files, estimated_duration=estimated_time)
+        job_id = job_manager.create_job(path_str, is_dependency,
+                                        total_files=total_files,
+                                        estimated_duration=estimated_time)
         
         # Create the coroutine for the background task and schedule it on the main event loop.
         coro = graph_builder.build_graph_from_path_async(
             path_obj, is_dependency, job_id
         )
-        asyncio.run_coroutine_threadsafe(coro, loop)
-        
-        debug_log(f"Started background job {job_id} for path: {str(path_obj)}, is_dependency: {is_dependency}")
+        job_manager.submit_many(loop, [coro])
         
+        debug_log(f"Started background job {job_id} for path: {path_str}, is_dependency: {is_dependency}")
+
         return {
             "success": True, "job_id": job_id,
-            "message": f"Background processing started for {str(path_obj)}",
+            "message": f"Background processing started for {path_str}",
             "estimated_files": total_files,
             "estimated_duration_seconds": round(estimated_time, 2),
-            "estimated_duration_human": f"{int(estimated_time // 60)}m {int(estimated_time % 60)}s" if estimated_time >= 60 else f"{int(estimated_time)}s",
+            "estimated_duration_human": _format_duration(estimated_time),
             "instructions": f"Use 'check_job_status' with job_id '{job_id}' to monitor progress"
         }
     
@@ -69,13 +82,16 @@ def add_package_to_graph(graph_builder, job_manager, loop, list_repos_func, **ar
 
     try:
         # Check if the package is already indexed
-        indexed_repos = list_repos_func().get("repositories", [])
-        for repo in indexed_repos:
-            if repo.get("is_dependency") and (repo.get("name") == package_name or repo.get("name") == f"{package_name}.py"):
-                return {
-                    "success": False,
-                    "message": f"Package '{package_name}' is already indexed."
-                }
+        indexed_dependency_names = frozenset(
+            repo.get("name")
+            for repo in list_repos_func().get("repositories", [])
+            if repo.get("is_dependency")
+        )
+        if package_name in indexed_dependency_names or f"{package_name}.py" in indexed_dependency_names:
+            return {
+                "success": False,
+                "message": f"Package '{package_name}' is already indexed."
+            }
 
         package_path = get_local_package_path(package_name, language)
         
@@ -89,14 +105,14 @@ def add_package_to_graph(graph_builder, job_manager, loop, list_repos_func, **ar
         
         total_files, estimated_time = graph_builder.estimate_processing_time(path_obj)
         
-        job_id = job_manager.create_job(package_path, is_dependency)
-        
-        job_manager.update_job(job_id, total_files=total_files, estimated_duration=estimated_time)
-        
+        job_id = job_manager.create_job(package_path, is_dependency,
+                                        total_files=total_files,
+                                        estimated_duration=estimated_time)
+
         coro = graph_builder.build_graph_from_path_async(
             path_obj, is_dependency, job_id
         )
-        asyncio.run_coroutine_threadsafe(coro, loop)
+        job_manager.submit_many(loop, [coro])
         
         debug_log(f"Started background job {job_id} for package: {package_name} at {package_path}, is_dependency: {is_dependency}")
         
@@ -106,7 +122,7 @@ def add_package_to_graph(graph_builder, job_manager, loop, list_repos_func, **ar
             "message": f"Background processing started for package '{package_name}'",
             "estimated_files": total_files,
             "estimated_duration_seconds": round(estimated_time, 2),
-            "estimated_duration_human": f"{int(estimated_time // 60)}m {int(estimated_time % 60)}s" if estimated_time >= 60 else f"{int(estimated_time)}s",
+            "estimated_duration_human": _format_duration(estimated_time),
             "instructions": f"Use 'check_job_status' with job_id '{job_id}' to monitor progress"
         }
     
@@ -412,7 +412,30 @@ def _get_dart_package_path(package_name: str) -> Optional[str]:
         debug_log(f"Error getting Dart package path for {package_name}: {e}")
         return None
 
+# Memo of successful lookups, keyed by (package_name, language). Resolving a
+# package walks the filesystem / runs subprocesses, so repeat requests for the
+# same package (UI refreshes, re-index attempts) should not pay that again.
+# Misses are deliberately not cached: the package may get installed later.
+_package_path_cache: dict = {}
+
+
 def get_local_package_path(package_name: str, language: str) -> Optional[str]:
+    """
+    Dispatches to the correct package path finder based on the language.
+    Successful lookups are cached for the lifetime of the process.
+    """
+    key = (package_name, language)
+    cached = _package_path_cache.get(key)
+    if cached is not None and Path(cached).exists():
+        return cached
+
+    path = _resolve_local_package_path(package_name, language)
+    if path:
+        _package_path_cache[key] = path
+    return path
+
+
+def _resolve_local_package_path(package_name: str, language: str) -> Optional[str]:
     """
     Dispatches to the correct package path finder based on the language.
     """
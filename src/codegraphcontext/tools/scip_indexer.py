@@ -34,6 +34,8 @@ import re
 import shutil
 import subprocess
 import tempfile
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -123,17 +125,39 @@ class ScipIndexer:
 
         info_logger(f"Running SCIP indexer: {' '.join(str(c) for c in cmd)}")
         try:
-            result = subprocess.run(
+            # Stream stderr instead of buffering it whole: indexers can emit
+            # megabytes of diagnostics on large projects, and we only ever
+            # report the tail. stdout is unused entirely. The stream stays in
+            # binary mode — only the tail is decoded, and only on failure.
+            with subprocess.Popen(
                 cmd,
                 cwd=str(project_path),
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute hard limit
-            )
-            if result.returncode != 0:
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            ) as process:
+                stderr_tail = deque(maxlen=64)  # last ~64 KB in 1 KB chunks
+
+                def _drain(stream=process.stderr, tail=stderr_tail):
+                    while True:
+                        chunk = stream.read(1024)
+                        if not chunk:
+                            break
+                        tail.append(chunk)
+
+                drain = threading.Thread(target=_drain, daemon=True)
+                drain.start()
+                try:
+                    returncode = process.wait(timeout=300)  # 5 minute hard limit
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    raise
+                drain.join(timeout=5)
+
+            if returncode != 0:
+                stderr_text = b"".join(stderr_tail).decode("utf-8", errors="replace")
                 warning_logger(
-                    f"SCIP indexer exited with code {result.returncode}.\n"
-                    f"stderr: {result.stderr[:500]}"
+                    f"SCIP indexer exited with code {returncode}.\n"
+                    f"stderr: {stderr_text[:500]}"
                 )
                 return None
 
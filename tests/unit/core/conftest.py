@@ -0,0 +1,26 @@
+
+import os
+
+import pytest
+
+# Database-selection variables stripped by pristine_db_env, alongside the
+# FALKORDB_/NEO4J_ prefixes.
+_DB_ENV_EXCLUDE = frozenset({'DATABASE_TYPE', 'DEFAULT_DATABASE', 'CGC_RUNTIME_DB_TYPE'})
+
+
+@pytest.fixture(scope="module")
+def clean_base_env():
+    """Environment snapshot without any database-related variables, computed once."""
+    return {
+        k: v for k, v in os.environ.items()
+        if k not in _DB_ENV_EXCLUDE
+        and k[:9] != 'FALKORDB_' and k[:6] != 'NEO4J_'
+    }
+
+
+@pytest.fixture
+def pristine_db_env(monkeypatch):
+    """Removes every database-related env var so the test controls routing."""
+    for k in list(os.environ):
+        if k.startswith(('FALKORDB_', 'NEO4J_')) or k in _DB_ENV_EXCLUDE:
+            monkeypatch.delenv(k, raising=False)
@@ -1,378 +1,471 @@
 
+import copy
 import os
+import sys
+import threading
+
+import falkordb
 import pytest
 from unittest.mock import MagicMock, patch, PropertyMock
 
+from codegraphcontext.core import get_database_manager
+from codegraphcontext.core.database_falkordb import FalkorDBDriverWrapper
+from codegraphcontext.core.database_falkordb_remote import (
+    FalkorDBRemoteManager,
+    _FalkorDBConnectionPool,
+    _PooledFalkorDBDriverWrapper,
+    _reset_config_for_tests,
+)
+
+# Prototype mock trio for the FalkorDB client, built once at import. Tests take
+# cheap shallow copies via the falkordb_mocks fixture instead of paying
+# MagicMock construction three times per test.
+_PROTO_FALKORDB = MagicMock()
+_PROTO_DB = MagicMock()
+_PROTO_GRAPH = MagicMock()
+_PROTO_FALKORDB.return_value = _PROTO_DB
+_PROTO_DB.select_graph.return_value = _PROTO_GRAPH
+
+
+@pytest.fixture
+def falkordb_mocks():
+    """(FalkorDB class, DB instance, graph) mocks copied from shared prototypes."""
+    mock_cls = copy.copy(_PROTO_FALKORDB)
+    mock_db = copy.copy(_PROTO_DB)
+    mock_graph = copy.copy(_PROTO_GRAPH)
+    for mock in (mock_cls, mock_db, mock_graph):
+        mock.reset_mock()
+    mock_cls.return_value = mock_db
+    mock_db.select_graph.return_value = mock_graph
+    return mock_cls, mock_db, mock_graph
+
+
+@pytest.fixture
+def patched_falkordb(falkordb_mocks):
+    """Installs the FalkorDB mock for the whole test, yielding the mock trio."""
+    with patch.object(falkordb, 'FalkorDB', falkordb_mocks[0]):
+        yield falkordb_mocks
+
+
+class _SingletonResetMixin:
+    """Shared singleton/config reset for every FalkorDBRemoteManager test class."""
+
+    @staticmethod
+    def _reset_singleton():
+        """Reset the singleton and cached env config so each test starts fresh."""
+        cls = FalkorDBRemoteManager
+        inst = cls._instance
+        cls._instance = cls._driver = cls._graph = None
+        # Strip _initialized from the old instance so a stale reference
+        # can't skip __init__ if it leaks into a later test.
+        if inst is not None:
+            inst.__dict__.pop('_initialized', None)
+        _reset_config_for_tests()
+
+    def setup_method(self, method):
+        if any(m.name == 'no_singleton_reset'
+               for m in getattr(method, 'pytestmark', ())):
+            # Staticmethod-only tests skip the singleton reset but still
+            # need the cached config re-read under their patched env.
+            _reset_config_for_tests()
+            return
+        self._reset_singleton()
+
+    teardown_method = setup_method
 
-class TestFalkorDBRemoteManager:
+
+class TestFalkorDBRemoteManager(_SingletonResetMixin):
     """
     Unit tests for the FalkorDBRemoteManager class.
     Mocks the FalkorDB client to test logic without a real remote DB.
     """
 
-    def _reset_singleton(self):
-        """Reset the singleton so each test starts fresh."""
-        from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
-        FalkorDBRemoteManager._instance = None
-        FalkorDBRemoteManager._driver = None
-        FalkorDBRemoteManager._graph = None
-        # Remove _initialized from any lingering instance
-        if FalkorDBRemoteManager._instance and hasattr(FalkorDBRemoteManager._instance, '_initialized'):
-            del FalkorDBRemoteManager._instance._initialized
-
-    def setup_method(self):
-        self._reset_singleton()
+    @pytest.fixture(autouse=True)
+    def _clean_state(self, monkeypatch, clean_base_env):
+        """Give every test a scrubbed environment; the mixin resets the singleton."""
+        monkeypatch.setattr(os, "environ", {**clean_base_env})
 
-    def teardown_method(self):
-        self._reset_singleton()
+    @pytest.fixture
+    def manager_with_host(self, monkeypatch):
+        """A manager built under the minimal valid config (host only)."""
+        monkeypatch.setenv('FALKORDB_HOST', 'h')
+        return FalkorDBRemoteManager()
 
-    def test_initialization_defaults(self):
+    def test_initialization_defaults(self, monkeypatch):
         """Test default config values when no env vars are set."""
-        env = {
-            'FALKORDB_HOST': 'myhost.example.com',
-        }
-        # Clear all FALKORDB_ env vars first
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-        clean_env.update(env)
-
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
-            self._reset_singleton()
-            manager = FalkorDBRemoteManager()
-
-            assert manager.host == 'myhost.example.com'
-            assert manager.port == 6379
-            assert manager.password is None
-            assert manager.username is None
-            assert manager.ssl is False
-            assert manager.graph_name == 'codegraph'
-
-    def test_initialization_custom_values(self):
+        monkeypatch.setenv('FALKORDB_HOST', 'myhost.example.com')
+
+        manager = FalkorDBRemoteManager()
+
+        assert manager.host == 'myhost.example.com'
+        assert manager.port == 6379
+        assert manager.password is None
+        assert manager.username is None
+        assert manager.ssl is False
+        assert manager.graph_name == 'codegraph'
+
+    def test_initialization_custom_values(self, monkeypatch):
         """Test that all env vars are correctly read."""
-        env = {
-            'FALKORDB_HOST': 'remote.falkordb.io',
-            'FALKORDB_PORT': '16379',
-            'FALKORDB_PASSWORD': 'secret123',
-            'FALKORDB_USERNAME': 'admin',
-            'FALKORDB_SSL': 'true',
-            'FALKORDB_GRAPH_NAME': 'mygraph',
-        }
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-        clean_env.update(env)
-
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
-            self._reset_singleton()
-            manager = FalkorDBRemoteManager()
-
-            assert manager.host == 'remote.falkordb.io'
-            assert manager.port == 16379
-            assert manager.password == 'secret123'
-            assert manager.username == 'admin'
-            assert manager.ssl is True
-            assert manager.graph_name == 'mygraph'
-
-    def test_ssl_variations(self):
-        """Test various truthy values for FALKORDB_SSL."""
-        for val in ('true', 'True', 'TRUE', '1', 'yes', 'YES'):
-            clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-            clean_env.update({'FALKORDB_HOST': 'h', 'FALKORDB_SSL': val})
-            with patch.dict(os.environ, clean_env, clear=True):
-                from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
-                self._reset_singleton()
-                manager = FalkorDBRemoteManager()
-                assert manager.ssl is True, f"Expected ssl=True for FALKORDB_SSL={val}"
-
-        for val in ('false', '0', 'no', ''):
-            clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-            clean_env.update({'FALKORDB_HOST': 'h', 'FALKORDB_SSL': val})
-            with patch.dict(os.environ, clean_env, clear=True):
-                from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
-                self._reset_singleton()
-                manager = FalkorDBRemoteManager()
-                assert manager.ssl is False, f"Expected ssl=False for FALKORDB_SSL={val}"
-
-    def test_get_driver_connects_with_correct_params(self):
+        monkeypatch.setenv('FALKORDB_HOST', 'remote.falkordb.io')
+        monkeypatch.setenv('FALKORDB_PORT', '16379')
+        monkeypatch.setenv('FALKORDB_PASSWORD', 'secret123')
+        monkeypatch.setenv('FALKORDB_USERNAME', 'admin')
+        monkeypatch.setenv('FALKORDB_SSL', 'true')
+        monkeypatch.setenv('FALKORDB_GRAPH_NAME', 'mygraph')
+
+        manager = FalkorDBRemoteManager()
+
+        assert manager.host == 'remote.falkordb.io'
+        assert manager.port == 16379
+        assert manager.password == 'secret123'
+        assert manager.username == 'admin'
+        assert manager.ssl is True
+        assert manager.graph_name == 'mygraph'
+
+    @pytest.mark.parametrize("val", ['true', 'True', 'TRUE', '1', 'yes', 'YES'])
+    def test_ssl_truthy(self, monkeypatch, val):
+        """Test truthy values for FALKORDB_SSL."""
+        monkeypatch.setenv('FALKORDB_HOST', 'h')
+        monkeypatch.setenv('FALKORDB_SSL', val)
+
+        manager = FalkorDBRemoteManager()
+        assert manager.ssl is True, f"Expected ssl=True for FALKORDB_SSL={val}"
+
+    @pytest.mark.parametrize("val", ['false', '0', 'no', ''])
+    def test_ssl_falsy(self, monkeypatch, val):
+        """Test falsy values for FALKORDB_SSL."""
+        monkeypatch.setenv('FALKORDB_HOST', 'h')
+        monkeypatch.setenv('FALKORDB_SSL', val)
+
+        manager = FalkorDBRemoteManager()
+        assert manager.ssl is False, f"Expected ssl=False for FALKORDB_SSL={val}"
+
+    def test_get_driver_connects_with_correct_params(self, monkeypatch, patched_falkordb):
         """Test that get_driver() calls FalkorDB with the right kwargs."""
-        env = {
-            'FALKORDB_HOST': 'remote.host',
-            'FALKORDB_PORT': '6380',
-            'FALKORDB_PASSWORD': 'pass',
-            'FALKORDB_USERNAME': 'user',
-            'FALKORDB_SSL': 'true',
-            'FALKORDB_GRAPH_NAME': 'testgraph',
-        }
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-        clean_env.update(env)
-
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
-
-            self._reset_singleton()
-            manager = FalkorDBRemoteManager()
-
-            mock_falkordb_cls = MagicMock()
-            mock_db_instance = MagicMock()
-            mock_graph = MagicMock()
-            mock_falkordb_cls.return_value = mock_db_instance
-            mock_db_instance.select_graph.return_value = mock_graph
-
-            with patch('falkordb.FalkorDB', mock_falkordb_cls):
-                driver_wrapper = manager.get_driver()
-
-            mock_falkordb_cls.assert_called_once_with(
-                host='remote.host',
-                port=6380,
-                password='pass',
-                username='user',
-                ssl=True,
-            )
-            mock_db_instance.select_graph.assert_called_once_with('testgraph')
-            mock_graph.query.assert_called_once_with("RETURN 1")
-
-            # Returns a FalkorDBDriverWrapper
-            from codegraphcontext.core.database_falkordb import FalkorDBDriverWrapper
-            assert isinstance(driver_wrapper, FalkorDBDriverWrapper)
-
-    def test_get_driver_minimal_params(self):
+        monkeypatch.setenv('FALKORDB_HOST', 'remote.host')
+        monkeypatch.setenv('FALKORDB_PORT', '6380')
+        monkeypatch.setenv('FALKORDB_PASSWORD', 'pass')
+        monkeypatch.setenv('FALKORDB_USERNAME', 'user')
+        monkeypatch.setenv('FALKORDB_SSL', 'true')
+        monkeypatch.setenv('FALKORDB_GRAPH_NAME', 'testgraph')
+
+        manager = FalkorDBRemoteManager()
+
+        mock_falkordb_cls, mock_db_instance, mock_graph = patched_falkordb
+
+        driver_wrapper = manager.get_driver(verify=True)
+
+        mock_falkordb_cls.assert_called_once_with(
+            host='remote.host',
+            port=6380,
+            password='pass',
+            username='user',
+            ssl=True,
+        )
+        mock_db_instance.select_graph.assert_called_once_with('testgraph')
+        mock_graph.query.assert_called_once_with("RETURN 1")
+
+        # Exact-type check: get_driver returns the pooled driver wrapper,
+        # which keeps the FalkorDBDriverWrapper session interface.
+        assert type(driver_wrapper) is _PooledFalkorDBDriverWrapper
+        assert isinstance(driver_wrapper, FalkorDBDriverWrapper)
+
+    def test_get_driver_minimal_params(self, monkeypatch, patched_falkordb):
         """Test get_driver with only host set (no password/username/ssl)."""
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-        clean_env.update({'FALKORDB_HOST': 'simple.host'})
+        monkeypatch.setenv('FALKORDB_HOST', 'simple.host')
 
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
+        manager = FalkorDBRemoteManager()
 
-            self._reset_singleton()
-            manager = FalkorDBRemoteManager()
+        mock_falkordb_cls, mock_db, mock_graph = patched_falkordb
 
-            mock_falkordb_cls = MagicMock()
-            mock_db = MagicMock()
-            mock_graph = MagicMock()
-            mock_falkordb_cls.return_value = mock_db
-            mock_db.select_graph.return_value = mock_graph
+        manager.get_driver()
 
-            with patch('falkordb.FalkorDB', mock_falkordb_cls):
-                manager.get_driver()
+        # Should NOT include password, username, or ssl
+        mock_falkordb_cls.assert_called_once_with(
+            host='simple.host',
+            port=6379,
+        )
+        # Liveness ping is opt-in; the default path skips the round-trip.
+        mock_graph.query.assert_not_called()
 
-            # Should NOT include password, username, or ssl
-            mock_falkordb_cls.assert_called_once_with(
-                host='simple.host',
-                port=6379,
-            )
-
-    def test_get_driver_singleton_reuses_connection(self):
+    def test_get_driver_singleton_reuses_connection(self, monkeypatch, patched_falkordb):
         """Test that calling get_driver() twice doesn't create a second connection."""
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-        clean_env.update({'FALKORDB_HOST': 'h'})
+        monkeypatch.setenv('FALKORDB_HOST', 'h')
 
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
+        manager = FalkorDBRemoteManager()
 
-            self._reset_singleton()
-            manager = FalkorDBRemoteManager()
+        mock_falkordb_cls, mock_db, mock_graph = patched_falkordb
 
-            mock_falkordb_cls = MagicMock()
-            mock_db = MagicMock()
-            mock_graph = MagicMock()
-            mock_falkordb_cls.return_value = mock_db
-            mock_db.select_graph.return_value = mock_graph
+        d1 = manager.get_driver()
+        d2 = manager.get_driver()
 
-            with patch('falkordb.FalkorDB', mock_falkordb_cls):
-                d1 = manager.get_driver()
-                d2 = manager.get_driver()
+        # FalkorDB constructor called only once
+        assert mock_falkordb_cls.call_count == 1
 
-            # FalkorDB constructor called only once
-            assert mock_falkordb_cls.call_count == 1
+    def test_pooled_sessions_scale_with_concurrency(self, monkeypatch):
+        """Test that sequential sessions reuse one connection and only overlapping
+        sessions grow the pool."""
+        monkeypatch.setenv('FALKORDB_HOST', 'h')
 
-    def test_is_connected_true(self):
-        """Test is_connected returns True when graph query succeeds."""
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-        clean_env.update({'FALKORDB_HOST': 'h'})
+        manager = FalkorDBRemoteManager()
 
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
+        mock_falkordb_cls = MagicMock(side_effect=lambda **kwargs: MagicMock())
 
-            self._reset_singleton()
-            manager = FalkorDBRemoteManager()
-            mock_graph = MagicMock()
-            manager._graph = mock_graph
+        with patch.object(falkordb, 'FalkorDB', mock_falkordb_cls):
+            driver = manager.get_driver()
 
-            assert manager.is_connected() is True
-            mock_graph.query.assert_called_with("RETURN 1")
+            # Back-to-back sessions recycle the same pooled connection.
+            with driver.session():
+                pass
+            with driver.session():
+                pass
+            assert mock_falkordb_cls.call_count == 1
 
-    def test_is_connected_false_no_graph(self):
-        """Test is_connected returns False when graph is None."""
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-        clean_env.update({'FALKORDB_HOST': 'h'})
+            # Overlapping sessions need a second connection.
+            with driver.session():
+                with driver.session():
+                    pass
+            assert mock_falkordb_cls.call_count == 2
 
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
+    def test_pooled_session_released_after_query_error(self, monkeypatch):
+        """Test that an application-level error recycles the connection."""
+        monkeypatch.setenv('FALKORDB_HOST', 'h')
 
-            self._reset_singleton()
-            manager = FalkorDBRemoteManager()
-            assert manager.is_connected() is False
+        manager = FalkorDBRemoteManager()
 
-    def test_is_connected_false_on_exception(self):
-        """Test is_connected returns False when query raises."""
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-        clean_env.update({'FALKORDB_HOST': 'h'})
+        mock_falkordb_cls = MagicMock(side_effect=lambda **kwargs: MagicMock())
 
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
+        with patch.object(falkordb, 'FalkorDB', mock_falkordb_cls):
+            driver = manager.get_driver()
 
-            self._reset_singleton()
-            manager = FalkorDBRemoteManager()
-            mock_graph = MagicMock()
-            mock_graph.query.side_effect = ConnectionError("disconnected")
-            manager._graph = mock_graph
+            with pytest.raises(ValueError):
+                with driver.session():
+                    raise ValueError("bad cypher")
 
-            assert manager.is_connected() is False
+            # The socket is still healthy, so the next session reuses it.
+            with driver.session():
+                pass
+            assert mock_falkordb_cls.call_count == 1
 
-    def test_get_backend_type(self):
+    def test_pooled_session_discarded_on_connection_error(self, monkeypatch):
+        """Test that a connection-level failure closes the socket and reconnects."""
+        monkeypatch.setenv('FALKORDB_HOST', 'h')
+
+        manager = FalkorDBRemoteManager()
+
+        created = []
+
+        def _make(**kwargs):
+            created.append(MagicMock())
+            return created[-1]
+
+        mock_falkordb_cls = MagicMock(side_effect=_make)
+
+        with patch.object(falkordb, 'FalkorDB', mock_falkordb_cls):
+            driver = manager.get_driver()
+
+            with pytest.raises(ConnectionError):
+                with driver.session():
+                    raise ConnectionError("socket died")
+
+            # The broken connection was closed and a fresh one replaces it.
+            created[0].close.assert_called_once()
+            with driver.session():
+                pass
+            assert mock_falkordb_cls.call_count == 2
+
+    def test_discard_wakes_blocked_acquirer(self, monkeypatch):
+        """Test that discarding a connection at capacity unblocks a waiting acquire."""
+        monkeypatch.setenv('FALKORDB_HOST', 'h')
+        monkeypatch.setenv('FALKORDB_POOL_SIZE', '1')
+
+        manager = FalkorDBRemoteManager()
+
+        mock_falkordb_cls = MagicMock(side_effect=lambda **kwargs: MagicMock())
+
+        with patch.object(falkordb, 'FalkorDB', mock_falkordb_cls):
+            manager.get_driver()
+            pool = manager._pool
+            conn = pool.acquire()
+
+            acquired = []
+            waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()),
+                                      daemon=True)
+            waiter.start()
+            # Give the waiter time to block on the saturated pool.
+            waiter.join(timeout=0.1)
+            assert waiter.is_alive()
+
+            # Discarding the only connection must hand its slot to the waiter.
+            pool.discard(conn)
+            waiter.join(timeout=5)
+            assert not waiter.is_alive()
+            assert len(acquired) == 1
+
+    def test_failed_connect_wakes_blocked_acquirer(self):
+        """Test that a failed connection attempt at capacity unblocks a waiting acquire."""
+        in_connect = threading.Event()
+        fail_connect = threading.Event()
+        attempts = []
+
+        def connect():
+            attempts.append(None)
+            if len(attempts) == 1:
+                in_connect.set()
+                fail_connect.wait(timeout=5)
+                raise ConnectionError("refused")
+            return (MagicMock(), MagicMock())
+
+        pool = _FalkorDBConnectionPool(connect, maxsize=1)
+
+        creator_errors = []
+
+        def create():
+            try:
+                pool.acquire()
+            except ConnectionError as e:
+                creator_errors.append(e)
+
+        creator = threading.Thread(target=create, daemon=True)
+        creator.start()
+        # The creator claims the only slot and is stuck inside connect().
+        assert in_connect.wait(timeout=5)
+
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()),
+                                  daemon=True)
+        waiter.start()
+        waiter.join(timeout=0.1)
+        assert waiter.is_alive()
+
+        # The creator's connect failure must hand the slot to the waiter,
+        # which retries with a fresh connection.
+        fail_connect.set()
+        waiter.join(timeout=5)
+        assert not waiter.is_alive()
+        assert len(acquired) == 1
+        assert len(creator_errors) == 1
+
+    @pytest.mark.parametrize("has_graph,expected", [(True, True), (False, False)])
+    def test_is_connected(self, manager_with_host, has_graph, expected):
+        """Test is_connected reflects local graph state, without a round-trip."""
+        mock_graph = MagicMock() if has_graph else None
+        manager_with_host._graph = mock_graph
+
+        assert manager_with_host.is_connected() is expected
+        if mock_graph is not None:
+            # is_connected is a local state check; no liveness query issued.
+            mock_graph.query.assert_not_called()
+
+    def test_ping_false_on_exception(self, manager_with_host):
+        """Test ping returns False when the liveness query raises."""
+        mock_graph = MagicMock()
+        mock_graph.query.side_effect = ConnectionError("disconnected")
+        manager_with_host._graph = mock_graph
+
+        assert manager_with_host.ping() is False
+
+    def test_ping_caches_positive_result(self, manager_with_host):
+        """Test that a successful ping is cached and not re-queried within the TTL."""
+        mock_graph = MagicMock()
+        manager_with_host._graph = mock_graph
+
+        assert manager_with_host.ping() is True
+        assert manager_with_host.ping() is True
+        mock_graph.query.assert_called_once_with("RETURN 1")
+
+    def test_get_backend_type(self, monkeypatch):
         """Test backend type string."""
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-        clean_env.update({'FALKORDB_HOST': 'h'})
-
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
+        monkeypatch.setenv('FALKORDB_HOST', 'h')
 
-            self._reset_singleton()
-            manager = FalkorDBRemoteManager()
-            assert manager.get_backend_type() == 'falkordb-remote'
+        manager = FalkorDBRemoteManager()
+        assert manager.get_backend_type() == 'falkordb-remote'
 
-    def test_close_driver(self):
+    def test_close_driver(self, monkeypatch):
         """Test close_driver clears internal state."""
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-        clean_env.update({'FALKORDB_HOST': 'h'})
-
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
+        monkeypatch.setenv('FALKORDB_HOST', 'h')
 
-            self._reset_singleton()
-            manager = FalkorDBRemoteManager()
-            manager._driver = MagicMock()
-            manager._graph = MagicMock()
+        manager = FalkorDBRemoteManager()
+        # Bare sentinels suffice — close_driver only nulls the attributes.
+        manager._driver = object()
+        manager._graph = object()
 
-            manager.close_driver()
-            assert manager._driver is None
-            assert manager._graph is None
+        manager.close_driver()
+        assert manager._driver is None
+        assert manager._graph is None
 
+    @pytest.mark.no_singleton_reset
     def test_validate_config_no_host(self):
         """Test validate_config fails when FALKORDB_HOST not set."""
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
+        valid, error = FalkorDBRemoteManager.validate_config()
+        assert valid is False
+        assert 'FALKORDB_HOST' in error
 
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
-            valid, error = FalkorDBRemoteManager.validate_config()
-            assert valid is False
-            assert 'FALKORDB_HOST' in error
-
-    def test_validate_config_valid(self):
+    @pytest.mark.no_singleton_reset
+    def test_validate_config_valid(self, monkeypatch):
         """Test validate_config succeeds with host set."""
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-        clean_env.update({'FALKORDB_HOST': 'myhost'})
+        monkeypatch.setenv('FALKORDB_HOST', 'myhost')
 
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
-            valid, error = FalkorDBRemoteManager.validate_config()
-            assert valid is True
-            assert error is None
+        valid, error = FalkorDBRemoteManager.validate_config()
+        assert valid is True
+        assert error is None
 
-    def test_validate_config_bad_port(self):
+    @pytest.mark.no_singleton_reset
+    def test_validate_config_bad_port(self, monkeypatch):
         """Test validate_config fails with non-numeric port."""
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-        clean_env.update({'FALKORDB_HOST': 'h', 'FALKORDB_PORT': 'abc'})
+        monkeypatch.setenv('FALKORDB_HOST', 'h')
+        monkeypatch.setenv('FALKORDB_PORT', 'abc')
 
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
-            valid, error = FalkorDBRemoteManager.validate_config()
-            assert valid is False
-            assert 'number' in error
+        valid, error = FalkorDBRemoteManager.validate_config()
+        assert valid is False
+        assert 'number' in error
 
-    def test_get_driver_import_error(self):
+    def test_get_driver_import_error(self, monkeypatch):
         """Test that missing falkordb package raises ValueError."""
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('FALKORDB_')}
-        clean_env.update({'FALKORDB_HOST': 'h'})
-
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
+        monkeypatch.setenv('FALKORDB_HOST', 'h')
 
-            self._reset_singleton()
-            manager = FalkorDBRemoteManager()
+        manager = FalkorDBRemoteManager()
 
-            with patch.dict('sys.modules', {'falkordb': None}):
-                with patch('builtins.__import__', side_effect=ImportError("no falkordb")):
-                    with pytest.raises(ValueError, match="FalkorDB client missing"):
-                        manager.get_driver()
+        # A None entry in sys.modules makes the next `import falkordb` raise
+        # ImportError without hooking builtins.__import__ globally.
+        monkeypatch.setitem(sys.modules, 'falkordb', None)
+        with pytest.raises(ValueError, match="FalkorDB client missing"):
+            manager.get_driver()
 
 
-class TestFactoryFalkorDBRemote:
+class TestFactoryFalkorDBRemote(_SingletonResetMixin):
     """Test that get_database_manager() correctly routes to FalkorDBRemoteManager."""
 
-    def setup_method(self):
-        from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
-        FalkorDBRemoteManager._instance = None
-        FalkorDBRemoteManager._driver = None
-        FalkorDBRemoteManager._graph = None
-
-    def teardown_method(self):
-        from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
-        FalkorDBRemoteManager._instance = None
-        FalkorDBRemoteManager._driver = None
-        FalkorDBRemoteManager._graph = None
+    @pytest.fixture(autouse=True)
+    def _clean_env(self, pristine_db_env):
+        """Strip database-related variables so each test controls routing."""
 
-    def test_explicit_falkordb_remote(self):
+    def test_explicit_falkordb_remote(self, monkeypatch):
         """Test DATABASE_TYPE=falkordb-remote returns FalkorDBRemoteManager."""
-        env = {
-            'DATABASE_TYPE': 'falkordb-remote',
-            'FALKORDB_HOST': 'myhost',
-        }
-        # Clear conflicting vars
-        clean_env = {k: v for k, v in os.environ.items()
-                     if k not in ('DATABASE_TYPE', 'DEFAULT_DATABASE', 'CGC_RUNTIME_DB_TYPE')
-                     and not k.startswith('FALKORDB_')}
-        clean_env.update(env)
-
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core import get_database_manager
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
-            manager = get_database_manager()
-            assert isinstance(manager, FalkorDBRemoteManager)
-
-    def test_explicit_falkordb_remote_missing_host(self):
+        monkeypatch.setenv('DATABASE_TYPE', 'falkordb-remote')
+        monkeypatch.setenv('FALKORDB_HOST', 'myhost')
+
+        manager = get_database_manager()
+        assert isinstance(manager, FalkorDBRemoteManager)
+
+    def test_explicit_falkordb_remote_missing_host(self, monkeypatch):
         """Test DATABASE_TYPE=falkordb-remote without FALKORDB_HOST raises."""
-        clean_env = {k: v for k, v in os.environ.items()
-                     if k not in ('DATABASE_TYPE', 'DEFAULT_DATABASE', 'CGC_RUNTIME_DB_TYPE')
-                     and not k.startswith('FALKORDB_')}
-        clean_env.update({'DATABASE_TYPE': 'falkordb-remote'})
+        monkeypatch.setenv('DATABASE_TYPE', 'falkordb-remote')
 
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core import get_database_manager
-            with pytest.raises(ValueError, match="FALKORDB_HOST is not set"):
-                get_database_manager()
+        with pytest.raises(ValueError, match="FALKORDB_HOST is not set"):
+            get_database_manager()
 
-    def test_auto_detect_remote_via_host(self):
+    def test_auto_detect_remote_via_host(self, monkeypatch):
         """Test that setting FALKORDB_HOST (without DATABASE_TYPE) auto-detects remote."""
-        clean_env = {k: v for k, v in os.environ.items()
-                     if k not in ('DATABASE_TYPE', 'DEFAULT_DATABASE', 'CGC_RUNTIME_DB_TYPE')
-                     and not k.startswith('FALKORDB_')
-                     and not k.startswith('NEO4J_')}
-        clean_env.update({'FALKORDB_HOST': 'auto-detected.host'})
-
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core import get_database_manager
-            from codegraphcontext.core.database_falkordb_remote import FalkorDBRemoteManager
-            manager = get_database_manager()
-            assert isinstance(manager, FalkorDBRemoteManager)
-            assert manager.host == 'auto-detected.host'
-
-    def test_unknown_db_type_includes_falkordb_remote(self):
+        monkeypatch.setenv('FALKORDB_HOST', 'auto-detected.host')
+
+        manager = get_database_manager()
+        assert isinstance(manager, FalkorDBRemoteManager)
+        assert manager.host == 'auto-detected.host'
+
+    def test_unknown_db_type_includes_falkordb_remote(self, monkeypatch):
         """Test that unknown DATABASE_TYPE error message mentions falkordb-remote."""
-        clean_env = {k: v for k, v in os.environ.items()
-                     if k not in ('DATABASE_TYPE', 'DEFAULT_DATABASE', 'CGC_RUNTIME_DB_TYPE')}
-        clean_env.update({'DATABASE_TYPE': 'badvalue'})
-
-        with patch.dict(os.environ, clean_env, clear=True):
-            from codegraphcontext.core import get_database_manager
-            with pytest.raises(ValueError, match="falkordb-remote"):
-                get_database_manager()
+        monkeypatch.setenv('DATABASE_TYPE', 'badvalue')
+
+        with pytest.raises(ValueError, match="falkordb-remote"):
+            get_database_manager()
@@ -33,3 +33,22 @@ class TestJobManager:
         job = manager.get_job("non_existent_id")
         assert job is None
 
+
+    def test_submit_many_schedules_all_coroutines(self):
+        import asyncio
+
+        manager = JobManager()
+        ran = []
+
+        async def record(n):
+            ran.append(n)
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            manager.submit_many(loop, [record(1), record(2), record(3)])
+            # Yield so the scheduled tasks get a chance to run.
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+        asyncio.run(main())
+        assert sorted(ran) == [1, 2, 3]